@@ -1,4 +1,6 @@
-# WIP might need to make an API call
+from ..dates.to_day_ordinal import to_day_ordinal
+from ..dates.get_today_ordinal import get_today_ordinal
+from ..dates.sum_by_day import sum_by_day
 
 # takes in number of days and user timezone
 # returns average of total daily burn in this period starting from today
@@ -8,34 +10,26 @@ def get_avg_daily_burn(daily_burns, days, timezone):
     Research shows that average daily burn is a key metric for assessing activity level.
     
     Parameters:
-    - daily_burns: List of tuples (date, calories burned) for each day
+    - daily_burns: List of tuples (date, calories burned) for each day,
+      dates zero-padded as "YYYY-MM-DD" (e.g., "2024-03-05", not "2024-3-5")
     - days: Number of days to average over (e.g., 30)
     - timezone: User's timezone for accurate date handling
     
     Returns: Average daily calories burned over the period
     """
-    from datetime import datetime, timedelta
-    import pytz
+    if not daily_burns or days <= 0:
+        return 0.0
+
+    date_strs, calories = zip(*daily_burns)
+
+    # Get today's date in user's timezone and sum burns in the window
+    today = get_today_ordinal(timezone)
+    totals, counts = sum_by_day(to_day_ordinal(date_strs), calories, today - (days - 1), days)
 
-    # Get today's date in user's timezone
-    user_tz = pytz.timezone(timezone)
-    today = datetime.now(user_tz).date()
-    
-    # Calculate the start date
-    start_date = today - timedelta(days=days - 1)
-    
-    # Filter burns within the date range and sum calories
-    total_burn = 0
-    count_days = 0
-    for date_str, calories in daily_burns:
-        date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        if start_date <= date <= today:
-            total_burn += calories
-            count_days += 1
-    
     # Avoid division by zero
+    count_days = int(counts.sum())
     if count_days == 0:
         return 0.0
-    
-    avg_daily_burn = total_burn / count_days
+
+    avg_daily_burn = float(totals.sum()) / count_days
     return avg_daily_burn
\ No newline at end of file
@@ -0,0 +1,12 @@
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+
+def _char_codes(strings: np.ndarray) -> np.ndarray:
+    """
+    View an array of strings as a (rows, max length) matrix of character codes, padded with 0.
+    """
+    return np.ascontiguousarray(strings).view(np.uint32).reshape(strings.size, -1)
+
+def _is_digit(codes: np.ndarray) -> np.ndarray:
+    return (codes >= ord("0")) & (codes <= ord("9"))
@@ -0,0 +1,17 @@
+import numpy as np
+
+def average_over_recorded_days(totals: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Average daily totals over the days that actually have records.
+    Days with no data (ring not worn) shouldn't drag the average down.
+
+    Parameters:
+    - totals: Per-day totals from sum_by_day
+    - counts: Per-day record counts from sum_by_day
+
+    Returns: Average per user (NaN when a user has no recorded days)
+    """
+    recorded_days = (counts > 0).sum(axis=-1)
+    return np.divide(totals.sum(axis=-1), recorded_days,
+                     out=np.full(recorded_days.shape, np.nan),
+                     where=recorded_days > 0)
@@ -0,0 +1,17 @@
+from datetime import datetime, timezone as dt_timezone
+
+import numpy as np
+
+from .to_local_day import to_local_day
+
+def get_today_ordinal(timezone: str) -> int:
+    """
+    Get today's local day ordinal in the user's timezone.
+
+    Parameters:
+    - timezone: User's timezone
+
+    Returns: Days since 1970-01-01 for today's local date
+    """
+    now = np.array([int(datetime.now(dt_timezone.utc).timestamp())], dtype=np.int64)
+    return int(to_local_day(now, timezone)[0])
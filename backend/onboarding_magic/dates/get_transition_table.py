@@ -0,0 +1,70 @@
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ._shared import SECONDS_PER_DAY
+
+def _utc_offset_at(tz: ZoneInfo, epoch_second: int) -> int:
+    return int(datetime.fromtimestamp(epoch_second, tz).utcoffset().total_seconds())
+
+@lru_cache(maxsize=None)
+def _get_year_transitions(timezone: str, year: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Find every UTC offset change in one (UTC) year by probing once a day
+    and bisecting each change down to the second.
+    """
+    tz = ZoneInfo(timezone)
+    year_start = int(datetime(year, 1, 1, tzinfo=dt_timezone.utc).timestamp())
+    year_end = int(datetime(year + 1, 1, 1, tzinfo=dt_timezone.utc).timestamp())
+
+    transitions = [year_start]
+    offsets = [_utc_offset_at(tz, year_start)]
+
+    for day_start in range(year_start, year_end, SECONDS_PER_DAY):
+        day_end = min(day_start + SECONDS_PER_DAY, year_end)
+        offset = _utc_offset_at(tz, day_end)
+        if offset == offsets[-1]:
+            continue
+
+        # Offset changed during this day, find the first second it applies
+        low, high = day_start, day_end
+        while high - low > 1:
+            middle = (low + high) // 2
+            if _utc_offset_at(tz, middle) == offsets[-1]:
+                low = middle
+            else:
+                high = middle
+
+        transitions.append(high)
+        offsets.append(offset)
+
+    return tuple(transitions), tuple(offsets)
+
+def get_transition_table(timezone: str, first_year: int, last_year: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the UTC offset transition table for a timezone over the years the data covers.
+    Lets us localize a whole array with one searchsorted instead of localizing
+    each row, and stays correct across DST changes.
+
+    Each year is probed through zoneinfo once and cached, so a cold process only
+    pays for the zones and years it actually sees.
+
+    Parameters:
+    - timezone: IANA timezone name (e.g., "America/Los_Angeles")
+    - first_year: First UTC year the table has to cover
+    - last_year: Last UTC year the table has to cover
+
+    Returns: (transition times in epoch seconds, UTC offset in seconds from each transition on)
+    """
+    transitions, offsets = [], []
+    for year in range(first_year, last_year + 1):
+        year_transitions, year_offsets = _get_year_transitions(timezone, year)
+        transitions.extend(year_transitions)
+        offsets.extend(year_offsets)
+
+    # Anything before the first year uses its starting offset
+    transitions[0] = np.iinfo(np.int64).min
+    return np.array(transitions, dtype=np.int64), np.array(offsets, dtype=np.int64)
@@ -0,0 +1,59 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .get_transition_table import get_transition_table
+
+def _year_range(epoch_seconds: np.ndarray):
+    years = epoch_seconds.astype("datetime64[s]").astype("datetime64[Y]").astype(np.int64) + 1970
+    return int(years.min()), int(years.max())
+
+def get_utc_offsets(epoch_seconds: np.ndarray,
+                    timezone: Union[str, Sequence[str]],
+                    zone_index: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Look up the UTC offset in effect at each instant.
+
+    Parameters:
+    - epoch_seconds: int64 array of seconds since 1970-01-01 UTC
+    - timezone: One timezone name for all records, or one per record
+      (e.g., when bucketing many users or a user who travelled)
+    - zone_index: Optional 0-based index into timezone for each record. Then timezone
+      lists each distinct zone once, which skips sorting millions of zone names
+
+    Returns: int64 array of UTC offsets in seconds, same shape as epoch_seconds
+
+    Raises: ValueError if the timezones don't line up with the timestamps
+    """
+    epoch_seconds = np.asarray(epoch_seconds, dtype=np.int64)
+    offsets = np.zeros(epoch_seconds.shape, dtype=np.int64)
+    if epoch_seconds.size == 0:
+        return offsets
+
+    flat_seconds = epoch_seconds.ravel()
+    flat_offsets = offsets.ravel()
+
+    if isinstance(timezone, str):
+        zones, order, boundaries = [timezone], np.arange(flat_seconds.size), [0, flat_seconds.size]
+    else:
+        if zone_index is None:
+            zones, zone_index = np.unique(np.asarray(timezone, dtype=np.str_).ravel(), return_inverse=True)
+        else:
+            zones, zone_index = list(timezone), np.asarray(zone_index, dtype=np.int64).ravel()
+            if zone_index.size and (zone_index.min() < 0 or zone_index.max() >= len(zones)):
+                raise ValueError(f"zone_index must be between 0 and {len(zones) - 1}")
+        if zone_index.size != flat_seconds.size:
+            raise ValueError(f"got {zone_index.size} timezones for {flat_seconds.size} timestamps")
+
+        # Sort records by zone once so each zone is one contiguous slice
+        order = np.argsort(zone_index, kind="stable")
+        boundaries = np.searchsorted(zone_index[order], np.arange(len(zones) + 1))
+
+    # Loop over distinct zones, never over rows
+    for i, zone in enumerate(zones):
+        rows = order[boundaries[i]:boundaries[i + 1]]
+        zone_seconds = flat_seconds[rows]
+        transitions, zone_offsets = get_transition_table(str(zone), *_year_range(zone_seconds))
+        flat_offsets[rows] = zone_offsets[np.searchsorted(transitions, zone_seconds, side="right") - 1]
+
+    return offsets
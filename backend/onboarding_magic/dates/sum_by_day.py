@@ -0,0 +1,51 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+def sum_by_day(days: np.ndarray,
+               values: np.ndarray,
+               start_day: int,
+               num_days: int,
+               user_index: Optional[np.ndarray] = None,
+               num_users: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum values per local day over a window, optionally per user.
+    Records outside [start_day, start_day + num_days) are ignored.
+
+    Parameters:
+    - days: Local day ordinal of each record
+    - values: Amount to add for each record (e.g., sleep seconds, calories)
+    - start_day: First day ordinal of the window
+    - num_days: Number of days in the window (e.g., 7 or 30)
+    - user_index: Optional 0-based user index of each record
+    - num_users: Number of users when user_index is given
+
+    Returns: (totals, record counts), each shaped (num_users, num_days)
+
+    Raises: ValueError if num_days or num_users isn't positive, or a user index is out of range
+    """
+    if num_days <= 0:
+        raise ValueError(f"num_days must be positive, got {num_days}")
+    if num_users <= 0:
+        raise ValueError(f"num_users must be positive, got {num_users}")
+
+    days = np.asarray(days, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    if user_index is None:
+        users = np.zeros(days.shape, dtype=np.int64)
+    else:
+        users = np.asarray(user_index, dtype=np.int64)
+        if users.shape != days.shape:
+            raise ValueError(f"got {users.size} user indexes for {days.size} records")
+        if users.size and (users.min() < 0 or users.max() >= num_users):
+            raise ValueError(f"user_index must be between 0 and {num_users - 1}, "
+                             f"got values from {users.min()} to {users.max()}")
+
+    offset = days - start_day
+    in_window = (offset >= 0) & (offset < num_days)
+    cells = users[in_window] * num_days + offset[in_window]
+    size = num_users * num_days
+
+    totals = np.bincount(cells, weights=values[in_window], minlength=size)
+    counts = np.bincount(cells, minlength=size)
+    return totals.reshape(num_users, num_days), counts.reshape(num_users, num_days)
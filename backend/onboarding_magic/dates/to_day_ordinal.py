@@ -0,0 +1,36 @@
+from typing import Sequence
+
+import numpy as np
+
+from ._shared import _char_codes, _is_digit
+
+def to_day_ordinal(date_strings: Sequence[str]) -> np.ndarray:
+    """
+    Convert zero-padded "YYYY-MM-DD" strings (already local dates) to day ordinals.
+
+    Parameters:
+    - date_strings: List of dates like "2024-03-10"
+
+    Returns: int64 array of days since 1970-01-01
+
+    Raises: ValueError if a date isn't exactly YYYY-MM-DD (e.g., "2024-03" or "2024-3-5")
+    """
+    dates = np.asarray(date_strings, dtype=np.str_).ravel()
+    if dates.size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # numpy would happily read "2024-03" as 2024-03-01, so check the shape first
+    chars = _char_codes(dates)
+    chars = np.pad(chars, ((0, 0), (0, max(0, 10 - chars.shape[1]))))
+    digit_columns = [0, 1, 2, 3, 5, 6, 8, 9]
+    valid = ((np.char.str_len(dates) == 10)
+             & (chars[:, 4] == ord("-")) & (chars[:, 7] == ord("-"))
+             & np.all(_is_digit(chars[:, digit_columns]), axis=1))
+    if not valid.all():
+        bad = dates[np.argmax(~valid)]
+        raise ValueError(f"date {bad!r} does not match format 'YYYY-MM-DD'")
+
+    try:
+        return dates.astype("datetime64[D]").astype(np.int64)
+    except ValueError as error:
+        raise ValueError(f"invalid date in batch: {error}") from None
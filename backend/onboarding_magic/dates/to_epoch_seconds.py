@@ -0,0 +1,86 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._shared import _char_codes, _is_digit
+from .get_utc_offsets import get_utc_offsets
+
+def to_epoch_seconds(timestamps: Sequence[str],
+                     timezone: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a batch of ISO 8601 timestamps to UTC epoch seconds in one pass.
+    Oura sends bedtime_start/bedtime_end like "2024-03-10T23:15:00.000-07:00".
+
+    Parameters:
+    - timestamps: ISO strings "YYYY-MM-DDTHH:MM:SS[.fff]" ending in "Z" or "+HH:MM"/"-HH:MM"
+      (fractional seconds are dropped)
+    - timezone: Optional timezone for timestamps without an offset. Without it they are rejected
+
+    Returns: (int64 array of seconds since 1970-01-01 UTC, int64 array of each record's UTC offset in seconds)
+
+    Raises: ValueError if a timestamp isn't in that form
+    """
+    stamps = np.asarray(timestamps, dtype=np.str_).ravel()
+    if stamps.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Strings differ in length (millis or not), so read the suffix straight out of the
+    # character matrix at positions counted from each string's end
+    chars = _char_codes(stamps)
+    rows = np.arange(stamps.size)
+    lengths = np.char.str_len(stamps)
+
+    def char_from_end(position):
+        return chars[rows, np.maximum(lengths - position, 0)]
+
+    def digit_from_end(position):
+        return char_from_end(position).astype(np.int64) - ord("0")
+
+    is_utc = (lengths > 19) & (char_from_end(1) == ord("Z"))
+    has_offset = ((lengths >= 25)
+                  & np.isin(char_from_end(6), [ord("+"), ord("-")])
+                  & (char_from_end(3) == ord(":"))
+                  & _is_digit(char_from_end(5)) & _is_digit(char_from_end(4))
+                  & _is_digit(char_from_end(2)) & _is_digit(char_from_end(1)))
+
+    offset_hours = digit_from_end(5) * 10 + digit_from_end(4)
+    offset_minutes = digit_from_end(2) * 10 + digit_from_end(1)
+    valid_offset = ~has_offset | ((offset_hours <= 23) & (offset_minutes <= 59))
+
+    # Everything before the suffix must be YYYY-MM-DDTHH:MM:SS with optional .fff
+    body_lengths = lengths - np.where(is_utc, 1, np.where(has_offset, 6, 0))
+    columns = np.arange(chars.shape[1])
+    padded = np.pad(chars, ((0, 0), (0, max(0, 20 - chars.shape[1]))))
+    is_fraction = (columns >= 20) & (columns < body_lengths[:, None])
+    valid_body = (
+        ((body_lengths == 19) | ((body_lengths > 20) & (padded[:, 19] == ord("."))))
+        & np.all(~is_fraction | _is_digit(chars), axis=1)
+        & (padded[:, 4] == ord("-")) & (padded[:, 7] == ord("-")) & (padded[:, 10] == ord("T"))
+        & (padded[:, 13] == ord(":")) & (padded[:, 16] == ord(":"))
+    )
+    has_no_offset = ~is_utc & ~has_offset
+
+    invalid = ~valid_body | ~valid_offset | (has_no_offset & (timezone is None))
+    if invalid.any():
+        bad = stamps[np.argmax(invalid)]
+        raise ValueError(f"timestamp {bad!r} does not match 'YYYY-MM-DDTHH:MM:SS[.fff]' "
+                         f"followed by 'Z' or '+HH:MM'")
+
+    # Wall clock part is always the first 19 characters
+    try:
+        wall_clock = stamps.astype("U19").astype("datetime64[s]").astype(np.int64)
+    except ValueError as error:
+        raise ValueError(f"invalid timestamp in batch: {error}") from None
+
+    sign = np.where(char_from_end(6) == ord("-"), -1, 1)
+    offsets = np.where(has_offset, sign * (offset_hours * 3600 + offset_minutes * 60), 0)
+
+    if has_no_offset.any():
+        # Treat the wall clock as UTC to guess the offset, then look it up again at the
+        # corrected instant. Wall times inside a DST gap or overlap get one of the two
+        # surrounding offsets, which is why Oura's own offsets are preferred
+        naive = wall_clock[has_no_offset]
+        guess = get_utc_offsets(naive, timezone)
+        offsets[has_no_offset] = get_utc_offsets(naive - guess, timezone)
+
+    return wall_clock - offsets, offsets
@@ -0,0 +1,26 @@
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .get_utc_offsets import get_utc_offsets
+from .to_local_day_from_offsets import to_local_day_from_offsets
+
+def to_local_day(epoch_seconds: np.ndarray,
+                 timezone: Union[str, Sequence[str]],
+                 day_start_hour: int = 0,
+                 zone_index: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Map UTC epoch seconds to local day ordinals (days since 1970-01-01 in the user's timezone).
+
+    Parameters:
+    - epoch_seconds: int64 array from to_epoch_seconds
+    - timezone: One timezone name for all records, or one per record
+      (e.g., when bucketing many users or a user who travelled)
+    - day_start_hour: Local hour the day rolls over (0 = midnight)
+    - zone_index: Optional 0-based index into timezone for each record, so timezone
+      only has to list each distinct zone once (see get_utc_offsets)
+
+    Returns: int64 array of local day ordinals, same shape as epoch_seconds
+    """
+    offsets = get_utc_offsets(epoch_seconds, timezone, zone_index)
+    return to_local_day_from_offsets(epoch_seconds, offsets, day_start_hour)
@@ -0,0 +1,21 @@
+import numpy as np
+
+from ._shared import SECONDS_PER_DAY
+
+def to_local_day_from_offsets(epoch_seconds: np.ndarray,
+                              offsets: np.ndarray,
+                              day_start_hour: int = 0) -> np.ndarray:
+    """
+    Map UTC epoch seconds to local day ordinals using each record's own UTC offset.
+    Use this when the source already says where the user was (e.g., Oura timestamps
+    from to_epoch_seconds), so travel and DST are handled without a timezone lookup.
+
+    Parameters:
+    - epoch_seconds: int64 array from to_epoch_seconds
+    - offsets: UTC offset in seconds of each record
+    - day_start_hour: Local hour the day rolls over (0 = midnight)
+
+    Returns: int64 array of local day ordinals (days since 1970-01-01)
+    """
+    local_seconds = np.asarray(epoch_seconds, dtype=np.int64) + np.asarray(offsets, dtype=np.int64)
+    return np.floor_divide(local_seconds - day_start_hour * 3600, SECONDS_PER_DAY)
@@ -0,0 +1,56 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..dates.to_epoch_seconds import to_epoch_seconds
+from ..dates.to_local_day_from_offsets import to_local_day_from_offsets
+from ..dates.get_today_ordinal import get_today_ordinal
+from ..dates.sum_by_day import sum_by_day
+from ..dates.average_over_recorded_days import average_over_recorded_days
+
+def get_avg_sleep_last_7_days(bedtime_starts: Sequence[str],
+                              bedtime_ends: Sequence[str],
+                              timezone: str,
+                              days: int = 7) -> Optional[float]:
+    """
+    Calculate average nightly sleep from raw Oura sleep records.
+    Each record counts toward the local day the user woke up on (bedtime_end),
+    so naps and split sleep on the same day add up to one night.
+    The day comes from each bedtime_end's own UTC offset, so nights spent
+    travelling or across a DST change land on the right day.
+
+    Parameters:
+    - bedtime_starts: ISO timestamps of when each sleep period started
+    - bedtime_ends: ISO timestamps of when each sleep period ended, same length as bedtime_starts
+    - timezone: User's home timezone, used for "today" and for timestamps without an offset
+    - days: Number of days to average over, ending today
+
+    Returns: Average hours of sleep per recorded night (feeds get_optimal_sleep),
+    or None when there's no sleep data in the window so it isn't mistaken for sleep debt
+
+    Raises: ValueError if the lists differ in length or a sleep period ends before it starts
+    """
+    if len(bedtime_starts) != len(bedtime_ends):
+        raise ValueError(f"got {len(bedtime_starts)} bedtime_starts for {len(bedtime_ends)} bedtime_ends")
+    if days <= 0:
+        return None
+
+    starts, _ = to_epoch_seconds(bedtime_starts, timezone)
+    ends, end_offsets = to_epoch_seconds(bedtime_ends, timezone)
+    durations = ends - starts
+    if (durations < 0).any():
+        bad = int(np.argmax(durations < 0))
+        raise ValueError(f"sleep period {bedtime_starts[bad]!r} to {bedtime_ends[bad]!r} ends before it starts")
+
+    # Someone east of home can already be on tomorrow's date, so their latest
+    # night still counts toward today
+    today = get_today_ordinal(timezone)
+    sleep_days = to_local_day_from_offsets(ends, end_offsets)
+    sleep_days = np.where(sleep_days == today + 1, today, sleep_days)
+
+    totals, counts = sum_by_day(sleep_days, durations, today - (days - 1), days)
+
+    avg_sleep = average_over_recorded_days(totals, counts)[0]
+    if np.isnan(avg_sleep):
+        return None
+    return float(avg_sleep) / 3600
@@ -0,0 +1,193 @@
+from datetime import datetime, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from onboarding_magic.dates.to_epoch_seconds import to_epoch_seconds
+from onboarding_magic.dates.to_local_day import to_local_day
+from onboarding_magic.dates.to_local_day_from_offsets import to_local_day_from_offsets
+from onboarding_magic.dates.to_day_ordinal import to_day_ordinal
+from onboarding_magic.dates.get_transition_table import get_transition_table
+from onboarding_magic.dates.get_utc_offsets import get_utc_offsets
+from onboarding_magic.dates.sum_by_day import sum_by_day
+from onboarding_magic.dates.average_over_recorded_days import average_over_recorded_days
+
+
+def day_ordinal(date_str):
+    return (datetime.strptime(date_str, "%Y-%m-%d").date() - datetime(1970, 1, 1).date()).days
+
+
+def test_to_epoch_seconds_parses_offsets_and_fractions():
+    stamps = [
+        "2024-03-10T23:15:00Z",
+        "2024-03-10T23:15:00-07:00",
+        "2024-03-10T23:15:00.000+05:30",
+        "2024-03-10T23:15:00.123456-08:00",
+    ]
+    epochs, offsets = to_epoch_seconds(stamps)
+
+    expected = [int(datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()) for s in stamps]
+    assert epochs.tolist() == expected
+    assert offsets.tolist() == [0, -7 * 3600, 5 * 3600 + 1800, -8 * 3600]
+
+
+def test_to_epoch_seconds_rejects_missing_offset():
+    with pytest.raises(ValueError):
+        to_epoch_seconds(["2024-03-10T23:15:00"])
+
+
+def test_to_epoch_seconds_rejects_offset_without_colon():
+    with pytest.raises(ValueError):
+        to_epoch_seconds(["2024-03-10T23:15:00+0530"])
+
+
+@pytest.mark.parametrize("stamp", ["2024-03-10T23:15:00+99:99", "2024-03-10T23:15:00+24:00", "2024-03-10T23:15:00-05:60"])
+def test_to_epoch_seconds_rejects_out_of_range_offset(stamp):
+    with pytest.raises(ValueError):
+        to_epoch_seconds([stamp])
+
+
+@pytest.mark.parametrize("stamp", ["2024-03-10", "2024-03-10 23:15:00Z", "2024-03-10T23:15:00.Z", "garbage"])
+def test_to_epoch_seconds_rejects_malformed(stamp):
+    with pytest.raises(ValueError):
+        to_epoch_seconds(["2024-03-10T23:15:00Z", stamp])
+
+
+def test_to_epoch_seconds_falls_back_to_timezone_without_offset():
+    epochs, offsets = to_epoch_seconds(["2024-03-10T23:15:00", "2024-01-10T23:15:00"], "America/Los_Angeles")
+
+    assert epochs.tolist() == [1710137700, 1704957300]
+    assert offsets.tolist() == [-7 * 3600, -8 * 3600]
+
+
+def test_to_epoch_seconds_empty():
+    epochs, offsets = to_epoch_seconds([])
+
+    assert epochs.size == 0 and offsets.size == 0
+
+
+@pytest.mark.parametrize("stamp", [
+    # Spring forward: 2024-03-10 02:00 PST -> 03:00 PDT
+    "2024-03-10T09:59:59Z", "2024-03-10T10:00:00Z",
+    # Fall back: 2024-11-03 02:00 PDT -> 01:00 PST
+    "2024-11-03T08:59:59Z", "2024-11-03T09:00:00Z",
+    # Late evening local, already the next day in UTC
+    "2024-03-11T06:59:59Z", "2024-11-04T07:59:59Z", "2024-11-04T08:00:00Z",
+])
+def test_to_local_day_los_angeles_dst_boundaries(stamp):
+    epochs, _ = to_epoch_seconds([stamp])
+    local = datetime.fromtimestamp(int(epochs[0]), ZoneInfo("America/Los_Angeles"))
+
+    assert to_local_day(epochs, "America/Los_Angeles")[0] == day_ordinal(local.strftime("%Y-%m-%d"))
+
+
+def test_transition_table_finds_exact_transitions():
+    transitions, offsets = get_transition_table("America/Los_Angeles", 2024, 2024)
+
+    spring_forward = 1710064800  # 2024-03-10T10:00:00Z
+    fall_back = 1730624400  # 2024-11-03T09:00:00Z
+    assert transitions[1:].tolist() == [spring_forward, fall_back]
+    assert offsets.tolist() == [-8 * 3600, -7 * 3600, -8 * 3600]
+
+
+def test_utc_offsets_match_zoneinfo_including_after_2037():
+    tz = ZoneInfo("America/Los_Angeles")
+    samples = np.arange(0, 2_300_000_000, 9_999_991, dtype=np.int64)
+
+    expected = [datetime.fromtimestamp(int(t), tz).utcoffset().total_seconds() for t in samples]
+    assert get_utc_offsets(samples, "America/Los_Angeles").tolist() == expected
+
+    summer_2040 = int(datetime(2040, 7, 1, tzinfo=dt_timezone.utc).timestamp())
+    assert get_utc_offsets(np.array([summer_2040]), "America/Los_Angeles")[0] == -7 * 3600
+
+
+@pytest.mark.parametrize("timezone,offset_hours", [("UTC", 0), ("Etc/GMT+5", -5)])
+def test_to_local_day_fixed_offset_zones(timezone, offset_hours):
+    epochs, _ = to_epoch_seconds(["2024-03-10T04:59:59Z", "2024-03-10T05:00:00Z"])
+    days = to_local_day(epochs, timezone)
+
+    expected = (epochs + offset_hours * 3600) // 86400
+    assert days.tolist() == expected.tolist()
+
+
+def test_to_local_day_per_record_timezones():
+    epochs, _ = to_epoch_seconds(["2024-03-10T20:00:00Z"] * 4)
+    days = to_local_day(epochs, ["UTC", "Asia/Tokyo", "America/Los_Angeles", "Asia/Tokyo"])
+
+    assert days.tolist() == [day_ordinal("2024-03-10"), day_ordinal("2024-03-11"),
+                             day_ordinal("2024-03-10"), day_ordinal("2024-03-11")]
+
+
+def test_to_local_day_rejects_mismatched_timezones():
+    with pytest.raises(ValueError):
+        to_local_day(np.array([0, 1, 2]), ["UTC", "Asia/Tokyo"])
+
+
+def test_to_local_day_from_offsets_uses_each_records_offset():
+    # Same UTC instant, woke up in Tokyo vs New York
+    epochs, offsets = to_epoch_seconds(["2024-03-11T07:00:00+09:00", "2024-03-10T18:00:00-04:00"])
+
+    assert epochs[0] == epochs[1]
+    assert to_local_day_from_offsets(epochs, offsets).tolist() == [day_ordinal("2024-03-11"), day_ordinal("2024-03-10")]
+
+
+def test_to_day_ordinal():
+    assert to_day_ordinal(["1970-01-01", "2024-03-10"]).tolist() == [0, day_ordinal("2024-03-10")]
+
+
+@pytest.mark.parametrize("date_str", ["2024-03", "2024-3-10", "2024-3-5", "2024-03-10T00:00", "2024/03/10", "2024-02-30"])
+def test_to_day_ordinal_rejects_non_dates(date_str):
+    with pytest.raises(ValueError):
+        to_day_ordinal(["2024-03-10", date_str])
+
+
+def test_sum_by_day_per_user():
+    days = np.array([10, 10, 11, 12, 9, 13])
+    values = np.array([1.0, 2.0, 3.0, 4.0, 100.0, 100.0])
+    users = np.array([0, 0, 1, 1, 0, 1])
+
+    totals, counts = sum_by_day(days, values, start_day=10, num_days=3, user_index=users, num_users=2)
+
+    assert totals.tolist() == [[3.0, 0.0, 0.0], [0.0, 3.0, 4.0]]
+    assert counts.tolist() == [[2, 0, 0], [0, 1, 1]]
+    assert average_over_recorded_days(totals, counts).tolist() == [3.0, 3.5]
+
+
+@pytest.mark.parametrize("users", [[0, 1], [0, -1]])
+def test_sum_by_day_rejects_out_of_range_user_index(users):
+    with pytest.raises(ValueError, match="user_index"):
+        sum_by_day(np.array([10, 10]), np.array([1.0, 2.0]), start_day=10, num_days=7,
+                   user_index=np.array(users), num_users=1)
+
+
+def test_sum_by_day_empty_window():
+    totals, counts = sum_by_day(np.array([1, 2]), np.array([5.0, 6.0]), start_day=100, num_days=7)
+
+    assert totals.shape == (1, 7)
+    assert counts.sum() == 0
+    assert np.isnan(average_over_recorded_days(totals, counts)[0])
+
+
+def test_sum_by_day_rejects_non_positive_window():
+    with pytest.raises(ValueError):
+        sum_by_day(np.array([1]), np.array([1.0]), start_day=0, num_days=0)
+
+
+def test_average_over_recorded_days_skips_days_without_data():
+    totals, counts = sum_by_day(np.array([0, 2]), np.array([6.0, 8.0]), start_day=0, num_days=7)
+
+    assert average_over_recorded_days(totals, counts).tolist() == [7.0]
+
+
+def test_to_local_day_zone_index_matches_zone_names():
+    epochs, _ = to_epoch_seconds(["2024-03-10T20:00:00Z"] * 4)
+    zones = ["UTC", "Asia/Tokyo", "America/Los_Angeles"]
+    zone_index = np.array([1, 0, 2, 1])
+
+    by_index = to_local_day(epochs, zones, zone_index=zone_index)
+    by_name = to_local_day(epochs, [zones[i] for i in zone_index])
+    assert by_index.tolist() == by_name.tolist()
+
+    with pytest.raises(ValueError, match="zone_index"):
+        to_local_day(epochs, zones, zone_index=np.array([0, 1, 2, 3]))
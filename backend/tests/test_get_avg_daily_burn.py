@@ -0,0 +1,49 @@
+from datetime import datetime, date, timedelta
+
+import pytest
+
+import onboarding_magic.activity.get_avg_daily_burn as get_avg_daily_burn_module
+from onboarding_magic.activity.get_avg_daily_burn import get_avg_daily_burn
+
+TODAY = date(2024, 3, 10)
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch):
+    monkeypatch.setattr(get_avg_daily_burn_module, "get_today_ordinal",
+                        lambda timezone: (TODAY - date(1970, 1, 1)).days)
+
+
+def old_get_avg_daily_burn(daily_burns, days, today):
+    # Pre-vectorization implementation, kept as the reference for parity
+    start_date = today - timedelta(days=days - 1)
+    total_burn = 0
+    count_days = 0
+    for date_str, calories in daily_burns:
+        burn_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        if start_date <= burn_date <= today:
+            total_burn += calories
+            count_days += 1
+    if count_days == 0:
+        return 0.0
+    return total_burn / count_days
+
+
+def test_get_avg_daily_burn_matches_old_implementation():
+    daily_burns = [(str(TODAY - timedelta(days=i)), 1400 + i * 3) for i in range(40)]
+    daily_burns.append((str(TODAY), 2800))  # Duplicate entry for today
+    daily_burns.append((str(TODAY + timedelta(days=1)), 9999))  # Future entry is ignored
+
+    for days in (-3, 0, 1, 7, 30, 60):
+        assert get_avg_daily_burn(daily_burns, days, "America/New_York") == pytest.approx(
+            old_get_avg_daily_burn(daily_burns, days, TODAY))
+
+
+def test_get_avg_daily_burn_empty():
+    assert get_avg_daily_burn([], 30, "America/New_York") == 0.0
+
+
+@pytest.mark.parametrize("date_str", ["2024-03", "2024-3-5"])
+def test_get_avg_daily_burn_requires_zero_padded_dates(date_str):
+    with pytest.raises(ValueError):
+        get_avg_daily_burn([(date_str, 1500)], 30, "UTC")
@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+
+import onboarding_magic.sleep.get_avg_sleep_last_7_days as get_avg_sleep_module
+from onboarding_magic.sleep.get_avg_sleep_last_7_days import get_avg_sleep_last_7_days
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch):
+    # "Now" is 2024-03-10 in New York
+    monkeypatch.setattr(get_avg_sleep_module, "get_today_ordinal",
+                        lambda timezone: (date(2024, 3, 10) - date(1970, 1, 1)).days)
+
+
+def test_buckets_by_wake_up_day_and_adds_naps():
+    starts = ["2024-03-09T23:00:00-05:00", "2024-03-10T13:00:00-04:00", "2024-03-08T23:30:00-05:00"]
+    ends = ["2024-03-10T07:00:00-04:00", "2024-03-10T14:00:00-04:00", "2024-03-09T06:30:00-05:00"]
+
+    assert get_avg_sleep_last_7_days(starts, ends, "America/New_York") == pytest.approx((7 + 1 + 7) / 2)
+
+
+def test_westward_travel_uses_records_own_offset():
+    # Woke up in Tokyo on the 10th, which is still the 9th in New York, so
+    # home-zone bucketing would push it out of a 1-day window
+    starts = ["2024-03-09T23:00:00+09:00"]
+    ends = ["2024-03-10T07:00:00+09:00"]
+
+    assert get_avg_sleep_last_7_days(starts, ends, "America/New_York", days=1) == pytest.approx(8)
+
+
+def test_eastward_travel_keeps_latest_night():
+    # Woke up in Tokyo on the 11th while it's still the 10th in New York
+    starts = ["2024-03-10T23:00:00+09:00"]
+    ends = ["2024-03-11T07:00:00+09:00"]
+
+    assert get_avg_sleep_last_7_days(starts, ends, "America/New_York") == pytest.approx(8)
+
+
+def test_no_data_returns_none():
+    starts = ["2024-02-01T23:00:00-05:00"]
+    ends = ["2024-02-02T07:00:00-05:00"]
+
+    assert get_avg_sleep_last_7_days(starts, ends, "America/New_York") is None
+    assert get_avg_sleep_last_7_days([], [], "America/New_York") is None
+    assert get_avg_sleep_last_7_days(starts, ends, "America/New_York", days=0) is None
+
+
+def test_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        get_avg_sleep_last_7_days(["2024-03-09T23:00:00-05:00"],
+                                  ["2024-03-10T07:00:00-04:00"] * 3, "America/New_York")
+
+
+def test_rejects_sleep_ending_before_it_starts():
+    with pytest.raises(ValueError):
+        get_avg_sleep_last_7_days(["2024-03-10T07:00:00-04:00"], ["2024-03-09T23:00:00-05:00"], "America/New_York")